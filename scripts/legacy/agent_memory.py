@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Agent Memory
+Append-only daily memory per agent with an in-process LRU cache and size-based retention
+"""
+
+import copy
+import datetime
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+MEMORY_SUFFIXES = (".json", ".jsonl")  # legacy single-document files sort first
+
+# (path, (mtime_ns, size)) for each file backing a day
+DayFiles = List[Tuple[Path, Tuple[int, int]]]
+
+
+class AgentMemory:
+    """Memory store laid out as memory/<agent>/<YYYY-MM-DD>.jsonl.
+
+    Each save appends one JSON line to the day's file, so several standups on
+    the same day are all kept. Parsed days stay in an LRU cache keyed by each
+    day file's mtime and size, so a day is reparsed only when it changed on
+    disk, including when another process wrote it. Reads return copies; writes
+    go to disk first and then update the cached day (write-through). Legacy
+    single-document <date>.json files are read as one entry. When the store
+    grows past `max_bytes`, the oldest day files are deleted first.
+    """
+
+    def __init__(self, memory_dir: Path, max_cached_days: int = 128,
+                 max_bytes: int = 100 * 1024 * 1024, logger: Optional[logging.Logger] = None):
+        self.memory_dir = memory_dir
+        self.max_cached_days = max_cached_days
+        self.max_bytes = max_bytes
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.cache: "OrderedDict[Tuple[str, datetime.date], Tuple[DayFiles, List[Dict]]]" = OrderedDict()
+        self.file_sizes: Optional[Dict[Path, int]] = None
+        self.lock = threading.RLock()
+
+    def day_files(self, agent_name: str, day: datetime.date) -> DayFiles:
+        """Files currently backing one agent's day, with their (mtime_ns, size) stamps"""
+        files = []
+        for suffix in MEMORY_SUFFIXES:
+            day_file = self.memory_dir / agent_name / f"{day}{suffix}"
+            try:
+                stat = day_file.stat()
+            except OSError:
+                continue
+            files.append((day_file, (stat.st_mtime_ns, stat.st_size)))
+        return files
+
+    def agent_days(self, agent_name: str) -> List[datetime.date]:
+        """Days that currently have memory files for the agent, oldest first"""
+        days = set()
+        try:
+            names = os.listdir(self.memory_dir / agent_name)
+        except OSError:
+            return []
+        for name in names:
+            stem, suffix = os.path.splitext(name)
+            if suffix not in MEMORY_SUFFIXES:
+                continue
+            try:
+                days.add(datetime.date.fromisoformat(stem))
+            except ValueError:
+                continue
+        return sorted(days)
+
+    def read_day(self, agent_name: str, day: datetime.date) -> List[Dict]:
+        """Entries for one agent and day, served from the LRU cache when unchanged on disk"""
+        with self.lock:
+            return copy.deepcopy(self.cached_day(agent_name, day))
+
+    def cached_day(self, agent_name: str, day: datetime.date) -> List[Dict]:
+        """The cached entry list for a day, reparsing the day files when their stamps changed"""
+        key = (agent_name, day)
+        with self.lock:
+            files = self.day_files(agent_name, day)
+            cached = self.cache.get(key)
+            if cached is not None and cached[0] == files:
+                self.cache.move_to_end(key)
+                return cached[1]
+
+            entries: List[Dict] = []
+            for day_file, _ in files:
+                try:
+                    with open(day_file, 'r') as f:
+                        if day_file.suffix == ".json":
+                            entries.append(json.load(f))
+                        else:
+                            entries.extend(json.loads(line) for line in f if line.strip())
+                except (OSError, ValueError) as e:
+                    self.logger.warning(f"Skipping unreadable memory file {day_file}: {e}")
+
+            self.remember(key, files, entries)
+            return entries
+
+    def remember(self, key: Tuple[str, datetime.date], files: DayFiles, entries: List[Dict]):
+        self.cache[key] = (files, entries)
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.max_cached_days:
+            self.cache.popitem(last=False)
+        if self.file_sizes is not None:
+            for day_file, (_, size) in files:
+                self.file_sizes[day_file] = size
+
+    def append(self, agent_name: str, data: Dict, day: Optional[datetime.date] = None):
+        """Append an entry to the agent's memory for `day` (default today)"""
+        day = day or datetime.date.today()
+        key = (agent_name, day)
+        day_file = self.memory_dir / agent_name / f"{day}.jsonl"
+        line = json.dumps(data, default=str) + "\n"
+
+        with self.lock:
+            # Load the day before writing so the cache never holds a partial view
+            entries = self.cached_day(agent_name, day)
+            previous_size = dict(self.cache[key][0]).get(day_file, (0, 0))[1]
+
+            day_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(day_file, 'a') as f:
+                f.write(line)
+
+            files = self.day_files(agent_name, day)
+            if dict(files).get(day_file, (0, 0))[1] == previous_size + len(line.encode()):
+                # Only our line was added: cache the value as it will read back from disk
+                entries.append(json.loads(line))
+                self.remember(key, files, entries)
+            else:
+                # Another process appended too; reparse on the next read
+                self.cache.pop(key, None)
+                if self.file_sizes is not None:
+                    self.file_sizes.update((path, stamp[1]) for path, stamp in files)
+
+            self.enforce_retention()
+
+    def latest(self, agent_name: str, day: Optional[datetime.date] = None) -> Optional[Dict]:
+        """Most recent entry for the agent on `day` (default today)"""
+        entries = self.read_day(agent_name, day or datetime.date.today())
+        return entries[-1] if entries else None
+
+    def history(self, agent_name: str, start: datetime.date,
+                end: Optional[datetime.date] = None) -> List[Tuple[datetime.date, Dict]]:
+        """All entries between `start` and `end` inclusive, oldest first"""
+        end = end or datetime.date.today()
+        with self.lock:
+            days = [day for day in self.agent_days(agent_name) if start <= day <= end]
+            return [(day, entry) for day in days for entry in self.read_day(agent_name, day)]
+
+    def recent(self, agent_name: str, days: int = 7) -> List[Tuple[datetime.date, Dict]]:
+        """Entries from the last `days` days including today"""
+        today = datetime.date.today()
+        return self.history(agent_name, today - datetime.timedelta(days=days - 1), today)
+
+    def scan_sizes(self):
+        """Stat every day file in the memory tree"""
+        self.file_sizes = {}
+        if not self.memory_dir.is_dir():
+            return
+        for agent_dir in self.memory_dir.iterdir():
+            if not agent_dir.is_dir():
+                continue
+            for day in self.agent_days(agent_dir.name):
+                for day_file, (_, size) in self.day_files(agent_dir.name, day):
+                    self.file_sizes[day_file] = size
+
+    def total_bytes(self) -> int:
+        """Store size as last seen by this process"""
+        if self.file_sizes is None:
+            self.scan_sizes()
+        return sum(self.file_sizes.values())
+
+    def enforce_retention(self):
+        """Delete the oldest day files until the store fits in `max_bytes`"""
+        with self.lock:
+            if self.total_bytes() <= self.max_bytes:
+                return
+
+            # Other processes may have written or pruned since; decide on a fresh scan
+            self.scan_sizes()
+            total = self.total_bytes()
+            today = datetime.date.today()
+            days: Dict[Tuple[datetime.date, str], List[Path]] = {}
+            for day_file in self.file_sizes:
+                day = datetime.date.fromisoformat(day_file.stem)
+                if day < today:
+                    days.setdefault((day, day_file.parent.name), []).append(day_file)
+
+            for day, agent_name in sorted(days):
+                if total <= self.max_bytes:
+                    break
+                for day_file in days[(day, agent_name)]:
+                    total -= self.file_sizes.pop(day_file, 0)
+                    day_file.unlink(missing_ok=True)
+                self.cache.pop((agent_name, day), None)
+                self.logger.info(f"🧹 Pruned memory for {agent_name} on {day}")
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Agent Registry
+Single source of agent, model and schedule configuration for both orchestrators
+"""
+
+import copy
+import json
+import os
+import re
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+RECIPE_CATEGORIES = ["main", "specialists", "subrecipes", "utilities"]
+REQUIRED_RECIPE_KEYS = ["version", "title", "description"]
+REQUIRED_AGENT_KEYS = ["recipe", "role", "model", "groups"]
+CACHE_VERSION = 1
+
+DAILY_PATTERN = re.compile(r"daily at (.+)")
+INTERVAL_PATTERN = re.compile(r"every (\d+)?\s*(minute|hour|day)s?")
+INTERVAL_UNITS = {"minute": 60, "hour": 60 * 60, "day": 24 * 60 * 60}
+
+
+def load_yaml(path: Path):
+    """Parse a YAML file, importing PyYAML only when a parse is actually needed"""
+    import yaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=loader)
+
+
+def parse_schedule(spec: str) -> Tuple[str, List[int]]:
+    """Parse "daily at 08:00, 14:00" / "every 4 hours" into ("daily", offsets) or ("interval", [seconds]).
+
+    Raises ValueError for anything else so bad schedules fail loudly.
+    """
+    normalized = str(spec).strip().lower()
+
+    daily = DAILY_PATTERN.fullmatch(normalized)
+    if daily:
+        offsets = []
+        for clock in daily.group(1).split(","):
+            match = re.fullmatch(r"(\d{1,2}):(\d{2})", clock.strip())
+            if not match or int(match.group(1)) > 23 or int(match.group(2)) > 59:
+                raise ValueError(f"invalid time '{clock.strip()}' in schedule '{spec}' (expected HH:MM)")
+            offsets.append(int(match.group(1)) * 3600 + int(match.group(2)) * 60)
+        return "daily", sorted(offsets)
+
+    interval = INTERVAL_PATTERN.fullmatch(normalized)
+    if interval:
+        count = int(interval.group(1) or 1)
+        if count <= 0:
+            raise ValueError(f"interval must be positive in schedule '{spec}'")
+        return "interval", [count * INTERVAL_UNITS[interval.group(2)]]
+
+    raise ValueError(f"unrecognised schedule '{spec}' (use 'daily at HH:MM[, HH:MM]' or 'every N hours|minutes')")
+
+
+def validate_recipe(data) -> List[str]:
+    """Return a list of problems with a parsed recipe (empty when valid)"""
+    if not isinstance(data, dict):
+        return ["recipe is not a mapping"]
+
+    errors = [f"missing '{key}'" for key in REQUIRED_RECIPE_KEYS if not data.get(key)]
+    if not data.get("instructions") and not data.get("prompt"):
+        errors.append("needs 'instructions' or 'prompt'")
+    for parameter in data.get("parameters") or []:
+        if not isinstance(parameter, dict) or not parameter.get("key"):
+            errors.append("parameter without 'key'")
+    return errors
+
+
+def validate_agent(config, models: Dict) -> List[str]:
+    """Return a list of problems with an agents.yaml entry (empty when valid)"""
+    if not isinstance(config, dict):
+        return ["entry is not a mapping"]
+
+    errors = [f"missing '{key}'" for key in REQUIRED_AGENT_KEYS if not config.get(key)]
+    if config.get("model") and config["model"] not in models:
+        errors.append(f"unknown model '{config['model']}'")
+    groups = config.get("groups")
+    if groups and (not isinstance(groups, list) or not all(isinstance(g, str) for g in groups)):
+        errors.append("'groups' must be a list of names")
+    return errors
+
+
+def recipe_metadata(path: Path, category: str) -> Dict:
+    """Extract the fields the orchestrators need from a recipe file"""
+    try:
+        data = load_yaml(path)
+    except Exception as e:
+        return {"category": category, "valid": False, "errors": [f"parse error: {e}"]}
+
+    errors = validate_recipe(data)
+    if not isinstance(data, dict):
+        return {"category": category, "valid": False, "errors": errors}
+
+    settings = data.get("settings") or {}
+    return {
+        "category": category,
+        "title": data.get("title"),
+        "description": data.get("description"),
+        "version": str(data.get("version")),
+        "model": settings.get("model"),
+        "parameters": [
+            {"key": p.get("key"), "required": p.get("requirement") == "required"}
+            for p in data.get("parameters") or [] if isinstance(p, dict)
+        ],
+        "sub_recipes": [s.get("name") for s in data.get("sub_recipes") or [] if isinstance(s, dict)],
+        "valid": not errors,
+        "errors": errors
+    }
+
+
+class AgentRegistry:
+    """Discover recipe YAMLs and expose the shared agent table.
+
+    Parsed recipe metadata is cached on disk keyed by each file's mtime and
+    size, so a normal startup only stats the recipe tree and reads one JSON
+    file; YAML is reparsed only for recipes that changed.
+    """
+
+    def __init__(self, project_root: Path, registry_file: Optional[Path] = None,
+                 cache_file: Optional[Path] = None, logger: Optional[logging.Logger] = None):
+        self.project_root = project_root
+        self.recipes_root = project_root / ".goose" / "recipes"
+        self.registry_file = registry_file or Path(__file__).parent / "agents.yaml"
+        self.cache_file = cache_file or project_root / ".goose" / "cache" / "agent-registry.json"
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.recipes: Dict[str, Dict] = {}
+        self.config: Dict = {}
+        self.agent_table: Dict[str, Dict] = {}
+        self.load()
+
+    def load_cache(self) -> Dict:
+        """Read the on-disk cache, discarding it if unreadable or outdated"""
+        try:
+            with open(self.cache_file, 'r') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if cache.get("version") != CACHE_VERSION:
+            return {}
+        return cache.get("entries", {})
+
+    def save_cache(self, entries: Dict):
+        """Atomically write the cache in compact form"""
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_suffix(".tmp")
+        with open(tmp_file, 'w') as f:
+            json.dump({"version": CACHE_VERSION, "entries": entries}, f, separators=(",", ":"))
+        os.replace(tmp_file, self.cache_file)
+
+    def load(self):
+        """Discover recipes and the agent table, reparsing only changed files"""
+        cached = self.load_cache()
+        entries: Dict[str, Dict] = {}
+        parsed = 0
+
+        sources = [(self.registry_file, "registry")]
+        for category in RECIPE_CATEGORIES:
+            category_dir = self.recipes_root / category
+            if category_dir.is_dir():
+                sources.extend((path, category) for path in sorted(category_dir.glob("*.yaml")))
+
+        for path, category in sources:
+            try:
+                stat = path.stat()
+            except OSError:
+                self.logger.error(f"Registry source missing: {path}")
+                continue
+
+            key = str(path)
+            stamp = [stat.st_mtime_ns, stat.st_size]
+            entry = cached.get(key)
+            if entry is None or entry["stamp"] != stamp:
+                if category == "registry":
+                    data = load_yaml(path) or {}
+                else:
+                    data = recipe_metadata(path, category)
+                entry = {"stamp": stamp, "data": data}
+                parsed += 1
+            entries[key] = entry
+
+        # Rewrite the cache only when something was reparsed or removed
+        if parsed or set(entries) != set(cached):
+            try:
+                self.save_cache(entries)
+            except OSError as e:
+                self.logger.warning(f"Could not write registry cache: {e}")
+
+        self.config = entries.get(str(self.registry_file), {}).get("data", {})
+        self.recipes = {}
+        for key, entry in entries.items():
+            if key == str(self.registry_file):
+                continue
+            path = Path(key)
+            if path.name in self.recipes:
+                self.logger.warning(f"Duplicate recipe name {path.name}, keeping {self.recipes[path.name]['path']}")
+                continue
+            self.recipes[path.name] = {**entry["data"], "path": str(path)}
+
+        for name, metadata in self.recipes.items():
+            if not metadata["valid"]:
+                self.logger.warning(f"Invalid recipe {name}: {'; '.join(metadata['errors'])}")
+
+        self.agent_table = self.resolve_agents()
+        self.logger.debug(f"Agent registry loaded ({parsed} file(s) parsed, {len(entries) - parsed} cached)")
+
+    def resolve_agents(self) -> Dict[str, Dict]:
+        """Attach recipe paths to the agent table, dropping invalid agents and those with missing or invalid recipes"""
+        agents = {}
+        models = self.models()
+        for name, config in (self.config.get("agents") or {}).items():
+            errors = validate_agent(config, models)
+            if errors:
+                self.logger.error(f"Invalid agent {name}: {'; '.join(errors)}")
+                continue
+            recipe = self.recipes.get(config.get("recipe"))
+            if recipe is None:
+                self.logger.error(f"Agent {name} references unknown recipe {config.get('recipe')}")
+                continue
+            if not recipe["valid"]:
+                self.logger.error(f"Agent {name} references invalid recipe {config['recipe']}")
+                continue
+            agents[name] = {
+                **config,
+                "recipe_path": recipe["path"],
+                "title": recipe["title"],
+                "schedule": self.resolve_schedule(name, config.get("schedule"))
+            }
+        return agents
+
+    def resolve_schedule(self, agent_name: str, schedule) -> List[Dict]:
+        """Normalise a schedule string or list of {spec, parameters} entries, dropping invalid ones"""
+        if not schedule:
+            return []
+        entries = []
+        for entry in schedule if isinstance(schedule, list) else [schedule]:
+            if not isinstance(entry, dict):
+                entry = {"spec": entry}
+            try:
+                parse_schedule(entry.get("spec", ""))
+            except ValueError as e:
+                self.logger.error(f"Agent {agent_name} has an invalid schedule: {e}")
+                continue
+            entries.append({"spec": entry["spec"], "parameters": dict(entry.get("parameters") or {})})
+        return entries
+
+    def agents(self, group: Optional[str] = None) -> Dict[str, Dict]:
+        """Registered agents, optionally limited to a group"""
+        return {
+            name: copy.deepcopy(config) for name, config in self.agent_table.items()
+            if not group or group in config.get("groups", [])
+        }
+
+    def recipe_path(self, agent_name: str) -> Optional[Path]:
+        """Absolute recipe path for an agent"""
+        agent = self.agent_table.get(agent_name)
+        return Path(agent["recipe_path"]) if agent else None
+
+    def models(self) -> Dict[str, Dict]:
+        """Model aliases mapped to their provider and model id"""
+        return dict(self.config.get("models") or {})
+
+    def schedules(self, group: Optional[str] = None) -> Dict[str, List[Dict]]:
+        """Clock jobs ({spec, parameters}) for each agent that declares a schedule"""
+        return {name: config["schedule"] for name, config in self.agents(group).items() if config["schedule"]}
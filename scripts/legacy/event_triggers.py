@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Event Trigger System
+Starts agents when their declared input paths change instead of on fixed clocks
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+import logging
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+# Directories that never count as agent inputs
+IGNORED_DIRS = {".git", "node_modules", "dist", "build", "coverage", "__pycache__", ".turbo"}
+
+# inotify constants (see <sys/inotify.h>)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0x00000800
+IN_CLOEXEC = 0x00080000
+
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+              IN_CREATE | IN_DELETE | IN_DELETE_SELF)
+EVENT_HEADER = struct.Struct("iIII")
+
+
+class InotifyWatcher:
+    """Recursive directory watcher backed by Linux inotify (via libc)"""
+
+    def __init__(self, roots: Iterable[Path]):
+        libc_name = ctypes.util.find_library("c")
+        if not sys.platform.startswith("linux") or not libc_name:
+            raise OSError("inotify is only available on Linux")
+
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self.watches: Dict[int, Path] = {}
+        for root in roots:
+            self.add_tree(root)
+
+    def add_watch(self, directory: Path):
+        """Watch a single directory"""
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(str(directory)), WATCH_MASK)
+        if wd >= 0:
+            self.watches[wd] = directory
+
+    def add_tree(self, root: Path):
+        """Watch a directory and all of its non-ignored subdirectories"""
+        if not root.is_dir():
+            return
+        for dirpath, dirnames, _ in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in IGNORED_DIRS]
+            self.add_watch(Path(dirpath))
+
+    def read_changes(self, timeout: float) -> Optional[Set[Path]]:
+        """Block up to `timeout` seconds and return changed paths.
+
+        Returns None when the kernel queue overflowed and events were lost.
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed: Set[Path] = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, name_len = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + name_len].rstrip(b"\0").decode(errors="replace")
+            offset += name_len
+
+            if mask & IN_Q_OVERFLOW:
+                return None
+            if mask & IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+
+            directory = self.watches.get(wd)
+            if directory is None:
+                continue
+            path = directory / name if name else directory
+            if name in IGNORED_DIRS:
+                continue
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                self.add_tree(path)
+            changed.add(path)
+
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Portable fallback that diffs mtime snapshots of the watched trees"""
+
+    def __init__(self, roots: Iterable[Path], interval: float = 5.0):
+        self.roots = list(roots)
+        self.interval = interval
+        self.snapshot = self.scan()
+
+    def scan(self) -> Dict[Path, float]:
+        """Map every watched file to its modification time"""
+        snapshot: Dict[Path, float] = {}
+        for root in self.roots:
+            if not root.is_dir():
+                continue
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = [d for d in dirnames if d not in IGNORED_DIRS]
+                for filename in filenames:
+                    path = Path(dirpath) / filename
+                    try:
+                        snapshot[path] = path.stat().st_mtime
+                    except OSError:
+                        continue
+        return snapshot
+
+    def read_changes(self, timeout: float) -> Optional[Set[Path]]:
+        """Sleep for the polling interval, rescan and return changed paths.
+
+        `timeout` is ignored: rescanning the trees is the expensive part, so
+        the polling interval always wins over the caller's wake-up timeout.
+        """
+        time.sleep(self.interval)
+        current = self.scan()
+        changed = {path for path, mtime in current.items() if self.snapshot.get(path) != mtime}
+        changed.update(path for path in self.snapshot if path not in current)
+        self.snapshot = current
+        return changed
+
+    def close(self):
+        pass
+
+
+class EventTriggerSystem:
+    """Debounce file changes and start only the agents whose inputs changed.
+
+    `agents` maps agent names to their orchestrator config; an agent takes
+    part when it declares `inputs` (paths relative to `project_root`) and may
+    set `min_interval` (seconds) to cap how often it can be re-triggered.
+    The watched roots default to the agents' inputs; inputs outside explicit
+    `watch_paths` are reported because they can never fire.
+    Changes that arrive while an agent is inside its minimum interval are kept
+    pending and fire once the interval has elapsed. Clock-driven runs of the
+    same agents should go through `run()` so they share the interval guard and
+    never overlap a triggered run.
+    """
+
+    def __init__(self, project_root: Path, watch_paths: Optional[List[str]], agents: Dict[str, Dict],
+                 run_agent: Callable[[str, Dict], Dict], debounce: float = 30.0,
+                 max_delay: float = 300.0, default_min_interval: float = 30 * 60,
+                 logger: Optional[logging.Logger] = None):
+        self.project_root = project_root
+        self.run_agent = run_agent
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.logger = logger or logging.getLogger(__name__)
+
+        # Agents that declare inputs, highest priority first
+        self.agents = {
+            name: config for name, config in sorted(agents.items(), key=lambda a: a[1].get("priority", 99))
+            if config.get("inputs")
+        }
+        self.min_intervals = {
+            name: config.get("min_interval", default_min_interval) for name, config in self.agents.items()
+        }
+        self.watch_roots = self.resolve_watch_roots(watch_paths)
+
+        # Pending change burst per agent: {"paths", "first", "last"}
+        self.pending: Dict[str, Dict] = {}
+        self.last_run: Dict[str, float] = {}
+        self.run_locks = {name: threading.Lock() for name in self.agents}
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.watcher = None
+
+    def resolve_watch_roots(self, watch_paths: Optional[List[str]]) -> List[Path]:
+        """Watched directories: `watch_paths`, or the union of the agents' inputs"""
+        if watch_paths is None:
+            watch_paths = [p for config in self.agents.values() for p in config["inputs"]]
+        prefixes = sorted({p.strip("/") for p in watch_paths if p.strip("/")})
+        
+        # Nested paths are covered by their parent's recursive watch
+        roots: List[str] = []
+        for prefix in prefixes:
+            if not any(prefix.startswith(root + "/") for root in roots):
+                roots.append(prefix)
+        
+        for name, config in self.agents.items():
+            for input_path in config["inputs"]:
+                prefix = input_path.strip("/")
+                if not any(prefix == root or prefix.startswith(root + "/") for root in roots):
+                    self.logger.error(f"❌ {name} input '{input_path}' is outside the watched paths and will never trigger")
+        return [self.project_root / root for root in roots]
+    
+    def create_watcher(self):
+        """Prefer inotify, fall back to polling when it is unavailable"""
+        try:
+            watcher = InotifyWatcher(self.watch_roots)
+            self.logger.info(f"👀 Watching {len(watcher.watches)} directories with inotify")
+            return watcher
+        except (OSError, AttributeError) as e:
+            self.logger.warning(f"inotify unavailable ({e}), falling back to polling")
+            return PollingWatcher(self.watch_roots)
+
+    def match_agents(self, changed: Iterable[Path]) -> Dict[str, Set[str]]:
+        """Map each agent to the changed paths that fall under its declared inputs"""
+        matches: Dict[str, Set[str]] = {}
+        for path in changed:
+            try:
+                relative = path.relative_to(self.project_root).as_posix()
+            except ValueError:
+                continue
+            for name, config in self.agents.items():
+                for input_path in config["inputs"]:
+                    prefix = input_path.rstrip("/")
+                    if relative == prefix or relative.startswith(prefix + "/"):
+                        matches.setdefault(name, set()).add(relative)
+                        break
+        return matches
+
+    def record_changes(self, changed: Optional[Set[Path]]):
+        """Queue agents for the changed paths (all agents on queue overflow)"""
+        if changed is None:
+            self.logger.warning("Watch queue overflowed, triggering every watched agent")
+            matches = {name: {"<overflow>"} for name in self.agents}
+        else:
+            matches = self.match_agents(changed)
+        if not matches:
+            return
+
+        now = time.monotonic()
+        with self.lock:
+            for name, paths in matches.items():
+                burst = self.pending.setdefault(name, {"paths": set(), "first": now, "last": now})
+                burst["paths"].update(paths)
+                burst["last"] = now
+
+    def due_agents(self) -> List[str]:
+        """Agents whose change burst has settled and whose minimum interval has passed"""
+        now = time.monotonic()
+        with self.lock:
+            due = []
+            for name in self.agents:
+                burst = self.pending.get(name)
+                if burst is None:
+                    continue
+                quiet = now - burst["last"] >= self.debounce
+                overdue = now - burst["first"] >= self.max_delay
+                if (quiet or overdue) and now - self.last_run.get(name, float("-inf")) >= self.min_intervals[name]:
+                    due.append(name)
+            return due
+
+    def run(self, name: str, parameters: Optional[Dict] = None) -> Dict:
+        """Run an agent unless it is already running, recording it for the min-interval guard.
+
+        Without `parameters` this is a triggered run and the pending changed
+        paths are passed to the agent; a clock run passes its own parameters.
+        Either way the run covers the changes seen so far.
+        """
+        run_lock = self.run_locks[name]
+        if not run_lock.acquire(blocking=False):
+            self.logger.info(f"⏭️ {name} is already running, skipping")
+            return {"status": "skipped", "agent": name}
+
+        try:
+            with self.lock:
+                changed_paths = sorted(self.pending.pop(name, {"paths": set()})["paths"])
+                self.last_run[name] = time.monotonic()
+
+            if parameters is None:
+                self.logger.info(f"⚡ Triggering {name} for {len(changed_paths)} changed path(s)")
+                parameters = {"changed_paths": ",".join(changed_paths[:50])}
+            return self.run_agent(name, parameters)
+        finally:
+            run_lock.release()
+
+    def dispatch(self):
+        """Run due agents one at a time in priority order"""
+        for name in self.due_agents():
+            try:
+                self.run(name)
+            except Exception as e:
+                self.logger.error(f"💥 Triggered {name} failed: {e}")
+
+    def watch_loop(self):
+        """Collect change events until stopped"""
+        while not self.stop_event.is_set():
+            try:
+                self.record_changes(self.watcher.read_changes(timeout=1.0))
+            except Exception as e:
+                self.logger.error(f"💥 Watcher error: {e}")
+                time.sleep(5)
+
+    def dispatch_loop(self):
+        """Start agents as their change bursts settle"""
+        while not self.stop_event.is_set():
+            self.dispatch()
+            self.stop_event.wait(1.0)
+
+    def start(self):
+        """Start the watcher and dispatcher threads"""
+        self.watcher = self.create_watcher()
+        threading.Thread(target=self.watch_loop, daemon=True).start()
+        threading.Thread(target=self.dispatch_loop, daemon=True).start()
+        self.logger.info(f"⚡ Event triggers armed for: {', '.join(self.agents)}")
+
+    def stop(self):
+        self.stop_event.set()
+        if self.watcher:
+            self.watcher.close()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Logging Pipeline
+Off-thread, rotating, structured JSON logging for the orchestrators
+"""
+
+import atexit
+import contextlib
+import contextvars
+import copy
+import datetime
+import json
+import logging
+import logging.handlers
+import queue
+from pathlib import Path
+from typing import Optional
+
+CONSOLE_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+CONTEXT_FIELDS = ("session_id", "agent")
+
+# Per-thread/per-task session context stamped onto every record
+_log_context: contextvars.ContextVar = contextvars.ContextVar("log_context", default={})
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+@contextlib.contextmanager
+def log_context(**fields):
+    """Attach fields such as session_id/agent to all records logged inside the block"""
+    token = _log_context.set({**_log_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+
+class ContextFilter(logging.Filter):
+    """Copy the current log context onto the record on the calling thread"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        for key, value in _log_context.get().items():
+            if not hasattr(record, key):
+                setattr(record, key, value)
+        return True
+
+
+class ContextQueueHandler(logging.handlers.QueueHandler):
+    """Enqueue records with context attached and tracebacks kept apart from the message"""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.addFilter(ContextFilter())
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, joinable with session records on session_id"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for field in CONTEXT_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+def setup_logging(logs_dir: Path, name: str, level: int = logging.INFO,
+                  retention_days: int = 14) -> logging.handlers.QueueListener:
+    """Route all logging through a queue to a rotating JSON file and the console.
+
+    Callers only enqueue records; a background listener thread does the
+    formatting and disk I/O. The log file rotates at midnight and keeps
+    `retention_days` old files. Calling this again reuses the running listener.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    logs_dir.mkdir(parents=True, exist_ok=True)
+
+    file_handler = logging.handlers.TimedRotatingFileHandler(
+        logs_dir / f"{name}.jsonl", when="midnight", backupCount=retention_days, encoding="utf-8"
+    )
+    file_handler.setFormatter(JsonFormatter())
+
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = ContextQueueHandler(log_queue)
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(stop_logging)
+    return _listener
+
+
+def stop_logging():
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -14,10 +14,14 @@ from typing import Dict, List, Optional
 import logging
 import schedule
 
+from agent_memory import AgentMemory
+from agent_registry import AgentRegistry
+from log_pipeline import log_context, setup_logging
+
 class PrivacyAgentOrchestrator:
     def __init__(self):
         self.base_dir = Path(__file__).parent.parent
-        self.recipes_dir = self.base_dir / "recipes"
+        self.project_root = self.base_dir.parent
         self.memory_dir = self.base_dir / "memory"
         self.outputs_dir = self.base_dir / "outputs"
         self.logs_dir = self.outputs_dir / "logs"
@@ -29,26 +33,16 @@ class PrivacyAgentOrchestrator:
         # Set up logging
         self.setup_logging()
         
-        # Agent configuration
-        self.agents = {
-            "orchestrator": {"recipe": "orchestrator.yaml", "priority": 1},
-            "product-manager": {"recipe": "product-manager.yaml", "priority": 2},
-            "developer": {"recipe": "developer.yaml", "priority": 3},
-            "tester": {"recipe": "tester.yaml", "priority": 4},
-            "content-creator": {"recipe": "content-creator.yaml", "priority": 5}
-        }
+        # Append-only agent memory with in-process cache
+        self.memory = AgentMemory(self.memory_dir, logger=self.logger)
+        
+        # Agent configuration shared with strategic-orchestration.py
+        self.registry = AgentRegistry(self.project_root, logger=self.logger)
+        self.agents = self.registry.agents("daily")
         
     def setup_logging(self):
         """Set up logging configuration"""
-        log_file = self.logs_dir / f"orchestrator_{datetime.date.today()}.log"
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler()
-            ]
-        )
+        setup_logging(self.logs_dir, "orchestrator")
         self.logger = logging.getLogger(__name__)
         
     def run_agent(self, agent_name: str, background: bool = False, 
@@ -58,7 +52,7 @@ class PrivacyAgentOrchestrator:
             self.logger.error(f"Unknown agent: {agent_name}")
             return {"status": "error", "message": f"Unknown agent: {agent_name}"}
             
-        recipe_path = self.recipes_dir / self.agents[agent_name]["recipe"]
+        recipe_path = self.agents[agent_name]["recipe_path"]
         
         # Build command
         cmd = ["goose", "run", "--recipe", str(recipe_path)]
@@ -71,52 +65,47 @@ class PrivacyAgentOrchestrator:
             for key, value in parameters.items():
                 cmd.extend(["--param", f"{key}={value}"])
         
-        self.logger.info(f"Running agent: {agent_name}")
-        self.logger.debug(f"Command: {' '.join(cmd)}")
+        with log_context(agent=agent_name):
+            self.logger.info(f"Running agent: {agent_name}")
+            self.logger.debug(f"Command: {' '.join(cmd)}")
         
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=3600)
+            try:
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=3600)
             
-            if result.returncode == 0:
-                self.logger.info(f"Agent {agent_name} completed successfully")
-                return {
-                    "status": "success",
-                    "agent": agent_name,
-                    "output": result.stdout
-                }
-            else:
-                self.logger.error(f"Agent {agent_name} failed: {result.stderr}")
-                return {
-                    "status": "error",
-                    "agent": agent_name,
-                    "error": result.stderr
-                }
+                if result.returncode == 0:
+                    self.logger.info(f"Agent {agent_name} completed successfully")
+                    return {
+                        "status": "success",
+                        "agent": agent_name,
+                        "output": result.stdout
+                    }
+                else:
+                    self.logger.error(f"Agent {agent_name} failed: {result.stderr}")
+                    return {
+                        "status": "error",
+                        "agent": agent_name,
+                        "error": result.stderr
+                    }
                 
-        except subprocess.TimeoutExpired:
-            self.logger.error(f"Agent {agent_name} timed out")
-            return {"status": "timeout", "agent": agent_name}
-        except Exception as e:
-            self.logger.error(f"Error running agent {agent_name}: {e}")
-            return {"status": "error", "agent": agent_name, "error": str(e)}
+            except subprocess.TimeoutExpired:
+                self.logger.error(f"Agent {agent_name} timed out")
+                return {"status": "timeout", "agent": agent_name}
+            except Exception as e:
+                self.logger.error(f"Error running agent {agent_name}: {e}")
+                return {"status": "error", "agent": agent_name, "error": str(e)}
     
     def save_to_memory(self, agent_name: str, data: Dict):
-        """Save agent data to memory"""
-        memory_file = self.memory_dir / agent_name / f"{datetime.date.today()}.json"
-        memory_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(memory_file, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
-            
+        """Append agent data to today's memory"""
+        self.memory.append(agent_name, data)
         self.logger.debug(f"Saved memory for {agent_name}")
         
     def load_from_memory(self, agent_name: str) -> Optional[Dict]:
-        """Load agent data from memory"""
-        memory_file = self.memory_dir / agent_name / f"{datetime.date.today()}.json"
-        
-        if memory_file.exists():
-            with open(memory_file, 'r') as f:
-                return json.load(f)
-        return None
+        """Load the latest agent data saved today"""
+        return self.memory.latest(agent_name)
+    
+    def load_history(self, agent_name: str, days: int = 7) -> List[Dict]:
+        """Load all agent data saved over the last `days` days, oldest first"""
+        return [entry for _, entry in self.memory.recent(agent_name, days)]
     
     def daily_standup(self):
         """Coordinate daily agent activities"""
@@ -205,6 +194,7 @@ class PrivacyAgentOrchestrator:
         report = {
             "date": str(datetime.date.today()),
             "agents_status": {},
+            "weekly_activity": {},
             "key_accomplishments": [],
             "issues": [],
             "next_steps": []
@@ -217,6 +207,7 @@ class PrivacyAgentOrchestrator:
                 report["agents_status"][agent_name] = "active"
             else:
                 report["agents_status"][agent_name] = "no_activity"
+            report["weekly_activity"][agent_name] = len(self.load_history(agent_name))
         
         # Save report
         report_file = self.outputs_dir / "reports" / f"daily_{datetime.date.today()}.json"
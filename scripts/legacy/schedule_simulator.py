@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Schedule Simulator
+Replays the orchestrator's real jobs on a virtual clock to capacity-plan lanes
+"""
+
+import heapq
+import json
+import math
+import random
+import logging
+from pathlib import Path
+from typing import Callable, Dict, Generator, List, Optional, Tuple
+
+from agent_registry import parse_schedule
+
+DAY = 24 * 60 * 60
+DEFAULT_DURATION = 60 * 60
+DEFAULT_TIMEOUT = 60 * 60  # run_strategic_agent kills sessions after session_duration, default 3600
+SCHEDULER_POLL = 60  # run_scheduler sleeps between run_pending calls
+TRIGGER_POLL = 1  # EventTriggerSystem.dispatch_loop wait
+DEVELOPER_BREAK = 15 * 60  # continuous_developer sleep after success
+DEVELOPER_BACKOFF = 30 * 60  # continuous_developer sleep after failure
+
+
+def load_session_history(strategic_dir: Path) -> Dict[str, Dict]:
+    """Collect (duration, succeeded) samples and failure rates per agent from saved session records"""
+    history: Dict[str, Dict] = {}
+    if not strategic_dir.is_dir():
+        return history
+
+    for session_file in strategic_dir.glob("*/*.json"):
+        try:
+            with open(session_file, 'r') as f:
+                session = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if not isinstance(session, dict) or "duration" not in session:
+            continue
+
+        agent = history.setdefault(session.get("agent", session_file.parent.name),
+                                   {"samples": [], "failures": 0, "sessions": 0})
+        succeeded = session.get("status") == "success"
+        agent["samples"].append((float(session["duration"]), succeeded))
+        agent["sessions"] += 1
+        if not succeeded:
+            agent["failures"] += 1
+
+    for agent in history.values():
+        agent["failure_rate"] = agent["failures"] / agent["sessions"]
+    return history
+
+
+class VirtualScheduler:
+    """Stands in for the `schedule` library: records the jobs the orchestrator registers"""
+
+    def __init__(self):
+        self.jobs: List[Dict] = []
+
+    def add(self, spec: str, job: Callable, *args, agents: List[str]):
+        kind, values = parse_schedule(spec)
+        label = agents[0] if len(agents) == 1 else getattr(job, "__name__", "job")
+        if kind == "interval":
+            self.jobs.append({"name": f"{label} every {values[0] // 60}m", "period": values[0],
+                              "offset": None, "agents": list(agents)})
+            return
+        for offset in values:
+            self.jobs.append({"name": f"{label} at {offset // 3600:02d}:{offset % 3600 // 60:02d}",
+                              "period": DAY, "offset": offset, "agents": list(agents)})
+
+
+class ScheduleSimulator:
+    """Discrete-event simulation of the orchestrator's threads on a virtual clock.
+
+    Lanes mirror the production threads: the `schedule` loop running the
+    registered clock jobs one after another, the event trigger dispatcher, and
+    one lane per continuous agent. Trigger-managed agents share the run guard:
+    a run is skipped while the same agent is busy on another lane, and any
+    run resets its minimum interval. The trigger lane assumes changes are
+    always pending, so it models the busiest possible repo. `max_concurrent`
+    optionally caps sessions across all lanes; waiting sessions then start in
+    priority order. Agent execution is stubbed by sampling historical
+    (duration, outcome) pairs.
+    """
+
+    def __init__(self, agents: Dict[str, Dict], history: Dict[str, Dict], jobs: List[Dict],
+                 trigger_agents: Optional[Dict[str, float]] = None,
+                 max_concurrent: Optional[int] = None, seed: int = 0,
+                 logger: Optional[logging.Logger] = None):
+        self.agents = agents
+        self.history = history
+        self.jobs = jobs
+        self.trigger_agents = trigger_agents or {}
+        self.max_concurrent = max_concurrent
+        self.random = random.Random(seed)
+        self.logger = logger or logging.getLogger(__name__)
+
+    def priority(self, agent: str) -> int:
+        return self.agents.get(agent, {}).get("priority", 99)
+
+    def sample_run(self, agent: str) -> Tuple[float, bool]:
+        """Stubbed agent execution: (duration, succeeded)"""
+        config = self.agents.get(agent, {})
+        timeout = config.get("session_duration", DEFAULT_TIMEOUT)
+        samples = self.history.get(agent, {}).get("samples")
+        if samples:
+            duration, succeeded = self.random.choice(samples)
+        else:
+            duration, succeeded = config.get("session_duration", DEFAULT_DURATION), True
+        if duration > timeout:
+            return timeout, False
+        return duration, succeeded
+
+    # Lane processes yield ("sleep", until) or ("run", lane, agent, requested_at)
+
+    def scheduler_lane(self) -> Generator:
+        """Mirror of run_scheduler: run_pending() runs due jobs in order, then sleeps a poll interval"""
+        for job in self.job_state:
+            job["next_run"] = self.next_run(job, 0.0)
+
+        while True:
+            due = sorted((job for job in self.job_state if job["next_run"] <= self.now),
+                         key=lambda job: job["next_run"])
+            for job in due:
+                job["delays"].append(self.now - job["next_run"])
+                requested_at = job["next_run"]
+                for agent in job["agents"]:
+                    yield ("run", "scheduler", agent, requested_at)
+                    requested_at = self.now
+
+                # Like `schedule`, the next run is computed from the completion time
+                next_run = self.next_run(job, self.now)
+                job["runs"] += 1
+                job["missed"] += max(0, int((next_run - job["next_run"]) // job["period"]) - 1)
+                job["next_run"] = next_run
+
+            gap = max(0.0, min(job["next_run"] for job in self.job_state) - self.now)
+            yield ("sleep", self.now + max(1, math.ceil(gap / SCHEDULER_POLL)) * SCHEDULER_POLL)
+
+    def trigger_lane(self) -> Generator:
+        """Mirror of EventTriggerSystem.dispatch_loop with changes always pending"""
+        ordered = sorted(self.trigger_agents, key=self.priority)
+        while True:
+            due = [agent for agent in ordered
+                   if self.now - self.last_run.get(agent, -math.inf) >= self.trigger_agents[agent]]
+            for agent in due:
+                requested_at = max(0.0, self.last_run.get(agent, -math.inf) + self.trigger_agents[agent])
+                yield ("run", "triggers", agent, requested_at)
+
+            next_due = min(self.last_run.get(agent, -math.inf) + self.trigger_agents[agent] for agent in ordered)
+            yield ("sleep", max(self.now + TRIGGER_POLL, next_due))
+
+    def continuous_lane(self, agent: str) -> Generator:
+        """Mirror of continuous_developer"""
+        while True:
+            result = yield ("run", agent, agent, self.now)
+            yield ("sleep", self.now + (DEVELOPER_BREAK if result is True else DEVELOPER_BACKOFF))
+
+    def next_run(self, job: Dict, now: float) -> float:
+        if job["offset"] is None:
+            return now + job["period"]
+        candidate = (now // DAY) * DAY + job["offset"]
+        return candidate if candidate > now else candidate + DAY
+
+    # Kernel
+
+    def push(self, at: float, kind: str, payload):
+        heapq.heappush(self.events, (at, self.sequence, kind, payload))
+        self.sequence += 1
+
+    def slots_full(self) -> bool:
+        return self.max_concurrent is not None and len(self.running_sessions) >= self.max_concurrent
+
+    def advance(self, process: Generator, value=None):
+        """Resume a lane process until it blocks on a sleep, a session, or a free slot"""
+        while True:
+            command = process.send(value)
+            if command[0] == "sleep":
+                self.push(command[1], "resume", (process, None))
+                return
+
+            _, lane, agent, requested_at = command
+            if agent in self.trigger_agents and agent in self.running:
+                # EventTriggerSystem.run() skips agents that are already running
+                self.agent_stats[agent]["skipped"] += 1
+                value = "skipped"
+                continue
+            if self.slots_full():
+                heapq.heappush(self.slot_waiters,
+                               (self.priority(agent), self.sequence, process, lane, agent, requested_at))
+                self.sequence += 1
+                return
+            self.start(process, lane, agent, requested_at)
+            return
+
+    def start(self, process: Generator, lane: str, agent: str, requested_at: float):
+        duration, succeeded = self.sample_run(agent)
+        self.running.add(agent)
+        self.running_sessions.append(agent)
+        if agent in self.trigger_agents:
+            self.last_run[agent] = self.now
+
+        lane_stats = self.lane_stats.setdefault(lane, {"busy_time": 0.0, "sessions": 0, "delays": []})
+        lane_stats["busy_time"] += min(duration, self.horizon - self.now)
+        lane_stats["sessions"] += 1
+        lane_stats["delays"].append(self.now - requested_at)
+
+        stats = self.agent_stats[agent]
+        stats["lanes"].add(lane)
+        stats["started"] += 1
+        stats["delays"].append(self.now - requested_at)
+        stats["durations"].append(duration)
+        self.push(self.now + duration, "end", (process, agent, succeeded))
+
+    def finish(self, process: Generator, agent: str, succeeded: bool):
+        self.running.discard(agent)
+        self.running_sessions.remove(agent)
+        self.agent_stats[agent]["completed" if succeeded else "failed"] += 1
+
+        # A freed slot goes to the highest-priority waiting lane
+        while self.slot_waiters and not self.slots_full():
+            _, _, waiter, lane, waiting_agent, requested_at = heapq.heappop(self.slot_waiters)
+            if waiting_agent in self.trigger_agents and waiting_agent in self.running:
+                self.agent_stats[waiting_agent]["skipped"] += 1
+                self.push(self.now, "resume", (waiter, "skipped"))
+                continue
+            self.start(waiter, lane, waiting_agent, requested_at)
+
+        self.advance(process, succeeded)
+
+    def run(self, days: float) -> Dict:
+        """Simulate `days` of operation and return the capacity report"""
+        if days <= 0:
+            raise ValueError("days must be positive")
+
+        self.horizon = days * DAY
+        self.now = 0.0
+        self.events: List[Tuple] = []
+        self.sequence = 0
+        self.running = set()
+        self.running_sessions: List[str] = []
+        self.slot_waiters: List[Tuple] = []
+        self.last_run: Dict[str, float] = {}
+        self.lane_stats: Dict[str, Dict] = {}
+        self.job_state = [dict(job, runs=0, missed=0, delays=[]) for job in self.jobs]
+
+        names = set(self.agents) | set(self.trigger_agents)
+        names.update(agent for job in self.jobs for agent in job["agents"])
+        self.agent_stats = {
+            name: {"lanes": set(), "started": 0, "completed": 0, "failed": 0, "skipped": 0,
+                   "delays": [], "durations": []}
+            for name in sorted(names)
+        }
+
+        processes = []
+        if self.job_state:
+            processes.append(self.scheduler_lane())
+        if self.trigger_agents:
+            processes.append(self.trigger_lane())
+        processes.extend(self.continuous_lane(name) for name, config in self.agents.items()
+                         if config.get("continuous"))
+        for process in processes:
+            self.advance(process)
+
+        while self.events and self.events[0][0] < self.horizon:
+            self.now, _, kind, payload = heapq.heappop(self.events)
+            if kind == "resume":
+                process, value = payload
+                self.advance(process, value)
+            else:
+                self.finish(*payload)
+
+        return self.report(days)
+
+    def report(self, days: float) -> Dict:
+        def minutes(values: List[float], fn) -> float:
+            return round(fn(values) / 60, 1) if values else 0.0
+
+        def mean(values: List[float]) -> float:
+            return sum(values) / len(values)
+
+        return {
+            "days": days,
+            "max_concurrent": self.max_concurrent,
+            "missed_schedules": sum(job["missed"] for job in self.job_state),
+            "lanes": {
+                name: {
+                    "utilization": round(lane["busy_time"] / self.horizon, 3),
+                    "sessions": lane["sessions"],
+                    "avg_queue_delay_min": minutes(lane["delays"], mean),
+                    "max_queue_delay_min": minutes(lane["delays"], max)
+                }
+                for name, lane in self.lane_stats.items()
+            },
+            "jobs": {
+                job["name"]: {
+                    "agents": job["agents"],
+                    "runs": job["runs"],
+                    "missed": job["missed"],
+                    "avg_start_delay_min": minutes(job["delays"], mean),
+                    "max_start_delay_min": minutes(job["delays"], max)
+                }
+                for job in self.job_state
+            },
+            "agents": {
+                name: {
+                    "lanes": sorted(stats["lanes"]),
+                    "started": stats["started"],
+                    "completed": stats["completed"],
+                    "failed": stats["failed"],
+                    "skipped": stats["skipped"],
+                    "avg_queue_delay_min": minutes(stats["delays"], mean),
+                    "max_queue_delay_min": minutes(stats["delays"], max),
+                    "avg_duration_min": minutes(stats["durations"], mean),
+                    "history_samples": len(self.history.get(name, {}).get("samples", []))
+                }
+                for name, stats in self.agent_stats.items()
+            }
+        }
@@ -4,6 +4,7 @@ zkSDK Strategic Orchestration System
 Top-tier strategic management for complex privacy SDK development
 """
 
+import argparse
 import subprocess
 import time
 import datetime
@@ -16,10 +17,27 @@ import schedule
 from typing import Dict, List, Optional
 import asyncio
 
+from agent_registry import AgentRegistry, parse_schedule
+from log_pipeline import log_context, setup_logging
+from schedule_simulator import ScheduleSimulator, VirtualScheduler, load_session_history
+from event_triggers import EventTriggerSystem
+
+class ClockScheduler:
+    """Register agents.yaml schedule specs as `schedule` library jobs"""
+    
+    def add(self, spec: str, job, *args, agents: List[str]):
+        """`agents` lists the agents the job runs, in order (used by the simulator)"""
+        kind, values = parse_schedule(spec)
+        if kind == "interval":
+            schedule.every(values[0]).seconds.do(job, *args)
+            return
+        for offset in values:
+            schedule.every().day.at(f"{offset // 3600:02d}:{offset % 3600 // 60:02d}").do(job, *args)
+
 class ZkSDKStrategicOrchestrator:
     def __init__(self):
         self.base_dir = Path(__file__).parent.parent
-        self.recipes_dir = self.base_dir
+        self.project_root = self.base_dir.parent
         self.outputs_dir = self.base_dir / "outputs"
         self.logs_dir = self.outputs_dir / "logs"
         
@@ -33,70 +51,42 @@ class ZkSDKStrategicOrchestrator:
         # Set up logging
         self.setup_logging()
         
-        # Strategic agent configurations
-        self.strategic_agents = {
-            "strategy_chief": {
-                "recipe": "recipe-strategy-chief.yaml",
-                "model": "claude",
-                "priority": 1,
-                "schedule": "daily at 08:00, 14:00, 20:00",
-                "session_duration": 90 * 60,  # 90 minutes
-                "role": "Chief Strategy Officer - Master project leader"
-            },
-            "marketing_growth": {
-                "recipe": "recipe-marketing-growth.yaml", 
-                "model": "groq",
-                "priority": 2,
-                "schedule": "every 4 hours",
-                "session_duration": 60 * 60,  # 60 minutes
-                "role": "Marketing & Growth Engine"
-            },
-            "research_intelligence": {
-                "recipe": "recipe-research-intelligence.yaml",
-                "model": "claude",
-                "priority": 2,
-                "schedule": "daily at 09:00",
-                "session_duration": 120 * 60,  # 2 hours
-                "role": "Research & Intelligence Mastermind"
-            },
-            "release_operations": {
-                "recipe": "recipe-release-operations.yaml",
-                "model": "claude", 
-                "priority": 3,
-                "schedule": "daily at 10:00, 16:00",
-                "session_duration": 45 * 60,  # 45 minutes
-                "role": "Release & Operations Director"
-            }
-        }
-        
-        # Development agents (from previous system)
-        self.development_agents = {
-            "developer": {
-                "recipe": "recipe-developer.yaml",
-                "model": "qwen-coder",
-                "continuous": True,
-                "priority": 4,
-                "role": "24/7 Coding Engine"
-            },
-            "tester": {
-                "recipe": "recipe-tester.yaml",
-                "model": "qwen-coder", 
-                "schedule": "every 2 hours",
-                "priority": 5,
-                "role": "Quality Guardian"
-            },
-            "social": {
-                "recipe": "recipe-social.yaml",
-                "model": "groq",
-                "schedule": "every 6 hours", 
-                "priority": 6,
-                "role": "Community Builder"
-            }
-        }
+        # Agent, model and schedule configuration shared with orchestrate.py
+        self.registry = AgentRegistry(self.project_root, logger=self.logger)
+        self.strategic_agents = self.registry.agents("strategic")
+        self.development_agents = self.registry.agents("development")
+        self.models = self.registry.models()
         
         # Combine all agents
         self.all_agents = {**self.strategic_agents, **self.development_agents}
         
+        # Event triggers watch the `inputs` declared in agents.yaml
+        self.event_triggers = None
+        
+        # Agents run by the morning briefing, in order: (result key, agent, log line, parameters)
+        self.morning_briefing = [
+            ("research", "research_intelligence", "📊 Research & Intelligence briefing...", {
+                "research_focus": "market",
+                "urgency_level": "immediate",
+                "stakeholder_focus": "strategic_team"
+            }),
+            ("strategy", "strategy_chief", "🎯 Chief Strategy Officer briefing...", {
+                "strategic_focus": "market",
+                "time_horizon": "30d",
+                "coordination_mode": "morning_briefing"
+            }),
+            ("marketing", "marketing_growth", "📈 Marketing & Growth briefing...", {
+                "campaign_focus": "awareness", 
+                "content_type": "technical",
+                "audience_segment": "developers"
+            }),
+            ("operations", "release_operations", "⚙️ Release & Operations briefing...", {
+                "operation_focus": "quality",
+                "priority_level": "high", 
+                "release_phase": "planning"
+            })
+        ]
+        
         # Strategic coordination state
         self.strategic_context = {}
         self.active_initiatives = []
@@ -104,16 +94,7 @@ class ZkSDKStrategicOrchestrator:
         
     def setup_logging(self):
         """Configure comprehensive logging"""
-        log_file = self.logs_dir / f"strategic_orchestrator_{datetime.date.today()}.log"
-        
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler()
-            ]
-        )
+        setup_logging(self.logs_dir, "strategic_orchestrator")
         self.logger = logging.getLogger(__name__)
         
     def run_strategic_agent(self, agent_name: str, parameters: Optional[Dict] = None) -> Dict:
@@ -123,25 +104,18 @@ class ZkSDKStrategicOrchestrator:
             return {"status": "error", "message": f"Unknown agent: {agent_name}"}
             
         agent_config = self.all_agents[agent_name]
-        recipe_path = self.recipes_dir / agent_config["recipe"]
+        recipe_path = agent_config["recipe_path"]
         
         # Build Goose command with model configuration
         cmd = ["goose", "run", "--recipe", str(recipe_path)]
         
         # Configure model based on agent requirements - using global OpenRouter setup
+        # Per-call environment: agents run concurrently on several threads
         model = agent_config["model"]
-        if model == "claude":
-            # Use default goose configuration for Claude (OpenRouter)
-            os.environ["GOOSE_PROVIDER"] = "openrouter"
-            os.environ["GOOSE_MODEL"] = "anthropic/claude-3.5-sonnet:beta"
-        elif model == "qwen-coder":
-            # Use default goose configuration for Qwen (OpenRouter)
-            os.environ["GOOSE_PROVIDER"] = "openrouter"
-            os.environ["GOOSE_MODEL"] = "qwen/qwen-2.5-coder-32b-instruct"
-        elif model == "groq":
-            # Use default goose configuration for Llama (OpenRouter)
-            os.environ["GOOSE_PROVIDER"] = "openrouter"
-            os.environ["GOOSE_MODEL"] = "meta-llama/llama-3.1-70b-instruct"
+        env = dict(os.environ)
+        if model in self.models:
+            env["GOOSE_PROVIDER"] = self.models[model]["provider"]
+            env["GOOSE_MODEL"] = self.models[model]["model"]
             
         # Add strategic context as parameters
         if parameters:
@@ -158,46 +132,64 @@ class ZkSDKStrategicOrchestrator:
         
         session_id = f"{agent_name}_strategic_{int(time.time())}"
         
-        self.logger.info(f"🎯 Starting strategic {agent_name} session: {session_id}")
+        with log_context(session_id=session_id, agent=agent_name):
+            self.logger.info(f"🎯 Starting strategic {agent_name} session: {session_id}")
         
-        try:
-            start_time = time.time()
-            result = subprocess.run(cmd, capture_output=True, text=True, 
-                                  timeout=agent_config.get("session_duration", 3600))
-            end_time = time.time()
+            try:
+                start_time = time.time()
+                result = subprocess.run(cmd, capture_output=True, text=True, env=env,
+                                      timeout=agent_config.get("session_duration", 3600))
+                end_time = time.time()
             
-            session_data = {
-                "session_id": session_id,
-                "agent": agent_name,
-                "agent_role": agent_config["role"],
-                "start_time": start_time,
-                "end_time": end_time, 
-                "duration": end_time - start_time,
-                "status": "success" if result.returncode == 0 else "error",
-                "output": result.stdout,
-                "error": result.stderr if result.returncode != 0 else None,
-                "strategic_context": self.strategic_context.copy(),
-                "model_used": model
-            }
+                session_data = {
+                    "session_id": session_id,
+                    "agent": agent_name,
+                    "agent_role": agent_config["role"],
+                    "start_time": start_time,
+                    "end_time": end_time, 
+                    "duration": end_time - start_time,
+                    "status": "success" if result.returncode == 0 else "error",
+                    "output": result.stdout,
+                    "error": result.stderr if result.returncode != 0 else None,
+                    "strategic_context": self.strategic_context.copy(),
+                    "model_used": model
+                }
             
-            # Save session data with strategic categorization
-            self.save_strategic_session(session_data)
+                # Save session data with strategic categorization
+                self.save_strategic_session(session_data)
             
-            # Extract strategic insights from successful sessions
-            if result.returncode == 0:
-                self.extract_strategic_insights(agent_name, session_data)
-                self.logger.info(f"✅ Strategic {agent_name} session completed successfully")
-            else:
-                self.logger.error(f"❌ Strategic {agent_name} session failed: {result.stderr}")
+                # Extract strategic insights from successful sessions
+                if result.returncode == 0:
+                    self.extract_strategic_insights(agent_name, session_data)
+                    self.logger.info(f"✅ Strategic {agent_name} session completed successfully")
+                else:
+                    self.logger.error(f"❌ Strategic {agent_name} session failed: {result.stderr}")
                 
-            return session_data
+                return session_data
             
-        except subprocess.TimeoutExpired:
-            self.logger.error(f"⏱️ Strategic {agent_name} session timed out")
-            return {"status": "timeout", "agent": agent_name, "session_id": session_id}
-        except Exception as e:
-            self.logger.error(f"💥 Error running strategic {agent_name}: {e}")
-            return {"status": "error", "agent": agent_name, "error": str(e)}
+            except subprocess.TimeoutExpired:
+                timeout = agent_config.get("session_duration", 3600)
+                session_data = {
+                    "session_id": session_id,
+                    "agent": agent_name,
+                    "agent_role": agent_config["role"],
+                    "start_time": start_time,
+                    "end_time": start_time + timeout,
+                    "duration": timeout,
+                    "status": "timeout",
+                    "output": None,
+                    "error": f"Session timed out after {timeout} seconds",
+                    "strategic_context": self.strategic_context.copy(),
+                    "model_used": model
+                }
+                
+                # Timed-out sessions are the longest ones; keep them in the history
+                self.save_strategic_session(session_data)
+                self.logger.error(f"⏱️ Strategic {agent_name} session timed out")
+                return session_data
+            except Exception as e:
+                self.logger.error(f"💥 Error running strategic {agent_name}: {e}")
+                return {"status": "error", "agent": agent_name, "error": str(e)}
     
     def save_strategic_session(self, session_data: Dict):
         """Save session data with strategic categorization"""
@@ -287,44 +279,12 @@ class ZkSDKStrategicOrchestrator:
             "focus_areas": ["market_analysis", "competitive_intelligence", "operational_status"]
         }
         
-        # Run strategic agents in coordinated sequence
+        # Run strategic agents in coordinated sequence:
+        # research gathers information, strategy coordinates, marketing plans, operations reports status
         briefing_results = {}
-        
-        # 1. Research & Intelligence first (information gathering)
-        self.logger.info("📊 Research & Intelligence briefing...")
-        research_result = self.run_strategic_agent("research_intelligence", {
-            "research_focus": "market",
-            "urgency_level": "immediate",
-            "stakeholder_focus": "strategic_team"
-        })
-        briefing_results["research"] = research_result
-        
-        # 2. Strategy Chief analysis and coordination
-        self.logger.info("🎯 Chief Strategy Officer briefing...")
-        strategy_result = self.run_strategic_agent("strategy_chief", {
-            "strategic_focus": "market",
-            "time_horizon": "30d",
-            "coordination_mode": "morning_briefing"
-        })
-        briefing_results["strategy"] = strategy_result
-        
-        # 3. Marketing & Growth tactical planning
-        self.logger.info("📈 Marketing & Growth briefing...")
-        marketing_result = self.run_strategic_agent("marketing_growth", {
-            "campaign_focus": "awareness", 
-            "content_type": "technical",
-            "audience_segment": "developers"
-        })
-        briefing_results["marketing"] = marketing_result
-        
-        # 4. Release & Operations status  
-        self.logger.info("⚙️ Release & Operations briefing...")
-        operations_result = self.run_strategic_agent("release_operations", {
-            "operation_focus": "quality",
-            "priority_level": "high", 
-            "release_phase": "planning"
-        })
-        briefing_results["operations"] = operations_result
+        for key, agent_name, message, parameters in self.morning_briefing:
+            self.logger.info(message)
+            briefing_results[key] = self.run_scheduled_agent(agent_name, parameters)
         
         # Save briefing summary
         briefing_summary = {
@@ -381,32 +341,59 @@ class ZkSDKStrategicOrchestrator:
         
         return risk_assessment
     
-    def schedule_strategic_operations(self):
-        """Schedule all strategic agent operations"""
-        # Morning strategic briefing
-        schedule.every().day.at("08:00").do(self.strategic_morning_briefing)
-        
-        # Individual agent schedules
-        schedule.every().day.at("14:00").do(self.run_strategic_agent, "strategy_chief", {"strategic_focus": "technical"})
-        schedule.every().day.at("20:00").do(self.run_strategic_agent, "strategy_chief", {"strategic_focus": "business"})
-        
-        # Marketing every 4 hours
-        schedule.every(4).hours.do(self.run_strategic_agent, "marketing_growth")
+    def schedule_strategic_operations(self, trigger_mode: str = "events", scheduler=None,
+                                      extra_schedules: Optional[Dict[str, List[Dict]]] = None):
+        """Schedule all strategic agent operations.
         
-        # Research daily
-        schedule.every().day.at("15:00").do(self.run_strategic_agent, "research_intelligence")
+        `scheduler` defaults to the real clock; the simulator passes a virtual one.
+        `extra_schedules` adds hypothetical agents' jobs for simulation.
+        """
+        scheduler = scheduler or ClockScheduler()
         
-        # Operations twice daily  
-        schedule.every().day.at("16:00").do(self.run_strategic_agent, "release_operations")
-        
-        self.logger.info("📅 Strategic operations scheduled")
+        # Morning strategic briefing
+        scheduler.add("daily at 08:00", self.strategic_morning_briefing,
+                      agents=[agent_name for _, agent_name, _, _ in self.morning_briefing])
+        
+        # Individual agent schedules declared in agents.yaml
+        schedules = {name: entries for name, entries in self.registry.schedules().items() if name in self.all_agents}
+        schedules.update(extra_schedules or {})
+        for agent_name, entries in schedules.items():
+            if trigger_mode == "events" and self.all_agents.get(agent_name, {}).get("inputs"):
+                # Input-driven agents only run when their watched paths change
+                continue
+            for entry in entries:
+                scheduler.add(entry["spec"], self.run_scheduled_agent, agent_name, entry["parameters"] or None,
+                              agents=[agent_name])
+        
+        self.logger.info(f"📅 Strategic operations scheduled ({trigger_mode} triggers)")
+    
+    def run_scheduled_agent(self, agent_name: str, parameters: Optional[Dict] = None) -> Dict:
+        """Run an agent from a clock job, sharing the event triggers' guard when they manage it"""
+        if self.event_triggers and agent_name in self.event_triggers.agents:
+            return self.event_triggers.run(agent_name, parameters or {})
+        return self.run_strategic_agent(agent_name, parameters)
+    
+    def start_event_triggers(self):
+        """Run agents whose declared inputs changed instead of on fixed clocks"""
+        self.event_triggers = EventTriggerSystem(
+            project_root=self.project_root,
+            watch_paths=None,
+            agents=self.all_agents,
+            run_agent=self.run_strategic_agent,
+            logger=self.logger
+        )
+        self.event_triggers.start()
     
-    def run_strategic_system(self):
+    def run_strategic_system(self, trigger_mode: str = "events"):
         """Run the complete strategic system"""
         self.logger.info("🚀 Starting zkSDK Strategic Management System")
         
+        # Input-driven agents run when their watched paths change
+        if trigger_mode == "events":
+            self.start_event_triggers()
+        
         # Schedule strategic operations
-        self.schedule_strategic_operations()
+        self.schedule_strategic_operations(trigger_mode)
         
         # Start continuous developer (from original system) in background
         developer_thread = threading.Thread(target=self.continuous_developer, daemon=True)
@@ -444,6 +431,41 @@ class ZkSDKStrategicOrchestrator:
                 self.logger.error(f"💥 Error in continuous developer: {e}")
                 time.sleep(60)
     
+    def simulate_schedule(self, days: float = 7, trigger_mode: str = "events",
+                          extra_agents: Optional[Dict[str, str]] = None,
+                          max_concurrent: Optional[int] = None, seed: int = 0) -> Dict:
+        """Capacity-plan the real schedule on a virtual clock using historical session records"""
+        agents = {name: dict(config) for name, config in self.all_agents.items()}
+        
+        # Hypothetical agents, e.g. {"aztec_specialist": "every 3 hours"}
+        extra_schedules = {}
+        existing = sorted(set(extra_agents or {}) & (set(self.registry.agents()) | set(agents)))
+        if existing:
+            raise ValueError(f"hypothetical agent name(s) already registered: {', '.join(existing)}")
+        for name, agent_schedule in (extra_agents or {}).items():
+            agents[name] = {"priority": 3, "role": "Simulated agent"}
+            extra_schedules[name] = [{"spec": agent_schedule, "parameters": {}}]
+        
+        # Register the same jobs production would, against a virtual clock
+        scheduler = VirtualScheduler()
+        self.schedule_strategic_operations(trigger_mode, scheduler=scheduler, extra_schedules=extra_schedules)
+        
+        trigger_agents = {}
+        if trigger_mode == "events":
+            probe = EventTriggerSystem(self.project_root, None, self.all_agents, self.run_strategic_agent)
+            trigger_agents = probe.min_intervals
+        
+        history = load_session_history(self.outputs_dir / "strategic")
+        self.logger.info(f"🧪 Simulating {days} day(s): {len(scheduler.jobs)} clock jobs, "
+                         f"{len(trigger_agents)} triggered agents "
+                         f"({sum(h['sessions'] for h in history.values())} historical sessions)")
+        
+        simulator = ScheduleSimulator(agents, history, scheduler.jobs, trigger_agents=trigger_agents,
+                                      max_concurrent=max_concurrent, seed=seed, logger=self.logger)
+        report = simulator.run(days)
+        report["trigger_mode"] = trigger_mode
+        return report
+    
     def run_scheduler(self):
         """Run the strategic scheduler"""
         self.logger.info("⏰ Starting strategic scheduler")
@@ -456,24 +478,71 @@ class ZkSDKStrategicOrchestrator:
                 self.logger.error(f"💥 Scheduler error: {e}")
                 time.sleep(60)
 
+def positive_float(value: str) -> float:
+    """argparse type for --days"""
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number: '{value}'")
+    if not 0 < number < float("inf"):
+        raise argparse.ArgumentTypeError(f"must be a positive finite number, got {value}")
+    return number
+
+def positive_int(value: str) -> int:
+    """argparse type for --max-concurrent"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+def agent_schedule(value: str) -> tuple:
+    """argparse type for --add-agent: NAME=SCHEDULE with a valid agents.yaml schedule spec"""
+    name, separator, spec = value.partition("=")
+    if not separator or not name.strip() or not spec.strip():
+        raise argparse.ArgumentTypeError(f"expected NAME=SCHEDULE, got '{value}'")
+    try:
+        parse_schedule(spec)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return name.strip(), spec.strip()
+
 def main():
     """Main entry point"""
-    import argparse
-    
     parser = argparse.ArgumentParser(description="zkSDK Strategic Management System")
-    parser.add_argument("--mode", choices=["full", "briefing", "agent"], 
+    parser.add_argument("--mode", choices=["full", "briefing", "agent", "simulate"], 
                        default="full", help="Run mode")
     parser.add_argument("--agent", help="Run specific strategic agent")
+    parser.add_argument("--triggers", choices=["events", "clock"], default="events",
+                       help="Start input-driven agents on file changes or on fixed clocks")
+    parser.add_argument("--days", type=positive_float, default=7, help="Days to simulate")
+    parser.add_argument("--add-agent", type=agent_schedule, action="append", metavar="NAME=SCHEDULE",
+                       help='Hypothetical agent for simulation, e.g. "zama_fhe=every 3 hours"')
+    parser.add_argument("--max-concurrent", type=positive_int,
+                       help="Cap on concurrent sessions across lanes during simulation")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for simulation")
     
     args = parser.parse_args()
     
     orchestrator = ZkSDKStrategicOrchestrator()
     
     if args.mode == "full":
-        orchestrator.run_strategic_system()
+        orchestrator.run_strategic_system(args.triggers)
     elif args.mode == "briefing":
         result = orchestrator.strategic_morning_briefing()
         print(json.dumps(result, indent=2, default=str))
+    elif args.mode == "simulate":
+        extra_agents = dict(args.add_agent or [])
+        if len(extra_agents) != len(args.add_agent or []):
+            parser.error("argument --add-agent: each NAME may only be added once")
+        existing = sorted(set(extra_agents) & set(orchestrator.registry.agents()))
+        if existing:
+            parser.error(f"argument --add-agent: already a registered agent: {', '.join(existing)}")
+        result = orchestrator.simulate_schedule(args.days, args.triggers, extra_agents,
+                                                args.max_concurrent, args.seed)
+        print(json.dumps(result, indent=2))
     elif args.mode == "agent" and args.agent:
         result = orchestrator.run_strategic_agent(args.agent)
         print(json.dumps(result, indent=2))